@@ -4,86 +4,278 @@ ROS2 Node Launcher - CLI Tool
 Easily launch single or multiple ROS2 nodes
 """
 
-import subprocess
+import os
+import selectors
+import shutil
 import sys
 import time
 import signal
-import argparse
-from typing import List, Dict
+from typing import List, Dict, Tuple
+
+READY_TIMEOUT = 0.2         # how long a fresh child is watched for early exit
+STOP_TIMEOUT = 5.0          # grace period before stopped nodes are SIGKILLed
+
+# Node table as parallel tuples; menu key N maps to index N-1.
+# These are rclpy console-script entry points of my_robot_controller, so
+# each runs as its own 'ros2 run' process. Loading them into a shared
+# component_container would require porting them to registered rclcpp
+# components first.
+NODE_NAMES = (
+    'publisher_node', 'subscriber_node', 'service_node', 'client_node',
+    'led_client', 'led_service', 'yes_no_service', 'yes_no_client',
+)
+NODE_DESCS = (
+    'Publisher Node', 'Subscriber Node', 'Service Node', 'Client Node',
+    'LED Client', 'LED Service', 'Yes/No Service', 'Yes/No Client',
+)
+VALID_KEYS = frozenset(str(i) for i in range(1, len(NODE_NAMES) + 1))
+
+_MENU_HEADER = (
+    "\n" + "="*60 + "\n"
+    "        ROS2 NODE LAUNCHER - SELECT NODES TO RUN\n"
+    + "="*60 + "\n"
+    "\nAvailable Nodes:\n"
+)
+_MENU_FOOTER = (
+    "\n\nCommands:\n"
+    "  [number]       - Launch single node (e.g., 1)\n"
+    "  [1,2,3]        - Launch multiple nodes (e.g., 1,2,3)\n"
+    "  [all]          - Launch all nodes\n"
+    "  [stop]         - Stop all running nodes\n"
+    "  [status]       - Show running nodes\n"
+    "  [quit/q]       - Exit\n"
+    + "="*60 + "\n"
+)
+
+
+def _write_lines(lines: List[str]):
+    """Emit a block of output lines as one write"""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
+
+def _detach_stdout():
+    """Send further output to /dev/null once the terminal has hung up"""
+    sys.stdout = open(os.devnull, 'w')
+
+
+def _alive(pid: int) -> bool:
+    """Liveness probe; reaped children fail os.kill(pid, 0) with ESRCH"""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    return True
+
 
 class ROS2NodeLauncher:
-    def __init__(self):
-        self.processes = {}
+    def __init__(self, launch_delay: float = 0.0):
+        self.processes: Dict[str, int] = {}  # node name -> pid
         self.package_name = 'my_robot_controller'
-        
-        self.available_nodes = {
-            '1': {'name': 'publisher_node', 'desc': 'Publisher Node'},
-            '2': {'name': 'subscriber_node', 'desc': 'Subscriber Node'},
-            '3': {'name': 'service_node', 'desc': 'Service Node'},
-            '4': {'name': 'client_node', 'desc': 'Client Node'},
-            '5': {'name': 'led_client', 'desc': 'LED Client'},
-            '6': {'name': 'led_service', 'desc': 'LED Service'},
-            '7': {'name': 'yes_no_service', 'desc': 'Yes/No Service'},
-            '8': {'name': 'yes_no_client', 'desc': 'Yes/No Client'}
-        }
+        self.launch_delay = launch_delay
+        self._ros2_bin = shutil.which('ros2') or 'ros2'  # resolve PATH once
+        self._argv = tuple(
+            (self._ros2_bin, 'run', self.package_name, name) for name in NODE_NAMES
+        )
+        self._running_mask = 0  # bit i set while node i is running
+        self._exit_codes: Dict[int, int] = {}  # pid -> exit code, set by the reaper
+        self._wakeup_fd = None  # self-pipe poked on SIGCHLD in interactive mode
+        self._stop_signals = None  # signals held blocked by command-line mode
+        self._aborted = False  # a held stop signal has been received
+    
+    def is_running(self, idx: int) -> bool:
+        """Check the running bitmap for a node index"""
+        return bool(self._running_mask & (1 << idx))
+    
+    def _track(self, idx: int, pid: int):
+        """Record a spawned node as running"""
+        self.processes[NODE_NAMES[idx]] = pid
+        self._running_mask |= 1 << idx
+    
+    def _untrack(self, idx: int):
+        """Forget a node that has exited or been stopped"""
+        self._exit_codes.pop(self.processes.pop(NODE_NAMES[idx]), None)
+        self._running_mask &= ~(1 << idx)
     
     def display_menu(self):
         """Display available nodes"""
-        print("\n" + "="*60)
-        print("        ROS2 NODE LAUNCHER - SELECT NODES TO RUN")
-        print("="*60)
-        print("\nAvailable Nodes:")
-        for key, node in self.available_nodes.items():
-            status = "🟢 RUNNING" if node['name'] in self.processes else "⚪ STOPPED"
-            print(f"  [{key}] {node['desc']:<25} - {status}")
-        print("\nCommands:")
-        print("  [number]       - Launch single node (e.g., 1)")
-        print("  [1,2,3]        - Launch multiple nodes (e.g., 1,2,3)")
-        print("  [all]          - Launch all nodes")
-        print("  [stop]         - Stop all running nodes")
-        print("  [status]       - Show running nodes")
-        print("  [quit/q]       - Exit")
-        print("="*60)
-    
-    def launch_node(self, node_name: str) -> bool:
+        mask = self._running_mask
+        body = "\n".join(
+            f"  [{i + 1}] {desc:<25} - {'🟢 RUNNING' if mask & (1 << i) else '⚪ STOPPED'}"
+            for i, desc in enumerate(NODE_DESCS)
+        )
+        sys.stdout.write(_MENU_HEADER + body + _MENU_FOOTER)
+        sys.stdout.flush()
+    
+    def launch_node(self, idx: int) -> bool:
         """Launch a single ROS2 node"""
-        if node_name in self.processes:
-            print(f"⚠️  {node_name} is already running (PID: {self.processes[node_name].pid})")
+        return bool(self._launch_batch([idx]))
+    
+    def _start_node(self, idx: int, out: List[str]) -> bool:
+        """Spawn a node without waiting for it to settle, logging to out"""
+        node_name = NODE_NAMES[idx]
+        if self.is_running(idx):
+            out.append(f"⚠️  {node_name} is already running (PID: {self.processes[node_name]})")
             return False
         
+        # Hold SIGCHLD until the child is tracked so the reaper can match it
+        old_mask = signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGCHLD})
         try:
-            print(f"🚀 Launching {node_name}...")
-            process = subprocess.Popen(
-                ['ros2', 'run', self.package_name, node_name],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
-            
-            self.processes[node_name] = process
-            print(f"✅ {node_name} started successfully (PID: {process.pid})")
+            out.append(f"🚀 Launching {node_name}...")
+            self._track(idx, self._spawn(self._argv[idx]))
             return True
             
         except Exception as e:
-            print(f"❌ Failed to launch {node_name}: {e}")
+            out.append(f"❌ Failed to launch {node_name}: {e}")
             return False
+        finally:
+            signal.pthread_sigmask(signal.SIG_SETMASK, old_mask)
     
-    def stop_node(self, node_name: str) -> bool:
-        """Stop a single node"""
-        if node_name not in self.processes:
-            print(f"⚠️  {node_name} is not running")
+    def _launch_batch(self, indices: List[int]) -> List[int]:
+        """Spawn all nodes back-to-back, then check readiness in one pass"""
+        out = []
+        if not self.launch_delay:
+            started = []
+            for idx in indices:
+                if self._stop_requested():
+                    break
+                if self._start_node(idx, out):
+                    started.append(idx)
+            ready = self._wait_ready(started, out)
+            _write_lines(out)
+            return ready
+        
+        # Strict ordering requested: settle each node before the next
+        ready = []
+        for n, idx in enumerate(indices):
+            if (n and self._pause(self.launch_delay)) or self._stop_requested():
+                break
+            if self._start_node(idx, out):
+                ready += self._wait_ready([idx], out)
+            _write_lines(out)
+            out.clear()
+        return ready
+    
+    def _stop_requested(self) -> bool:
+        """Consume a pending stop signal held blocked by command-line mode"""
+        if self._stop_signals and not self._aborted:
+            self._take_stop_signal(0)
+        return self._aborted
+    
+    def _pause(self, delay: float) -> bool:
+        """Sleep between launches; returns True if a stop signal cut it short"""
+        if not self._stop_signals:
+            time.sleep(delay)
             return False
+        if not self._aborted:
+            self._take_stop_signal(delay)
+        return self._aborted
+    
+    def _take_stop_signal(self, timeout: float):
+        """Wait up to timeout for a held stop signal and record it"""
+        info = signal.sigtimedwait(self._stop_signals, timeout)
+        if info is not None:
+            self._aborted = True
+            if info.si_signo == signal.SIGHUP:
+                _detach_stdout()
+    
+    def _wait_ready(self, indices: List[int], out: List[str]) -> List[int]:
+        """Watch fresh children briefly so immediate failures surface at once"""
+        deadline = time.monotonic() + READY_TIMEOUT
+        while indices:
+            pids = [self.processes[NODE_NAMES[idx]] for idx in indices]
+            if not self._wait_exit(pids, deadline - time.monotonic(), any_exit=True):
+                break
+            for idx, pid in zip(indices, pids):
+                if not _alive(pid):
+                    code = self._exit_codes.get(pid)
+                    self._untrack(idx)
+                    out.append(f"❌ {NODE_NAMES[idx]} exited immediately (code {code})")
+            indices = [idx for idx in indices if self.is_running(idx)]
         
+        for idx in indices:
+            out.append(f"✅ {NODE_NAMES[idx]} started successfully (PID: {self.processes[NODE_NAMES[idx]]})")
+        return indices
+
+    def _spawn(self, argv: Tuple[str, ...]) -> int:
+        """Start argv with posix_spawn (constant-time, no fork page-table copy)
+
+        Node output is discarded and each child leads its own session so the
+        whole ``ros2 run`` process tree can be signalled as one group.
+        """
+        pid = os.posix_spawnp(argv[0], argv, os.environ, setsid=True, setsigmask=(), file_actions=[
+            (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+            (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+        ])
+        return pid
+
+    def _install_reaper(self):
+        """Reap children from a SIGCHLD handler instead of polling wait()"""
+        signal.signal(signal.SIGCHLD, self._on_sigchld)
+    
+    def _on_sigchld(self, sig, frame):
+        """SIGCHLD handler: collect exited children and wake the menu loop"""
+        self._reap_children()
+        if self._wakeup_fd is not None:
+            try:
+                os.write(self._wakeup_fd, b'\0')
+            except BlockingIOError:
+                pass  # a wakeup is already pending
+    
+    def _reap_children(self):
+        """Collect every exited child without blocking"""
+        tracked = set(self.processes.values())
+        while True:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if not pid:
+                return
+            if pid in tracked:
+                self._exit_codes[pid] = os.waitstatus_to_exitcode(status)
+    
+    def _reap_dead(self) -> List[str]:
+        """Reap exited children, untrack them and return their report lines"""
+        self._reap_children()
+        lines = []
+        for idx in range(len(NODE_NAMES)):
+            if self.is_running(idx):
+                pid = self.processes[NODE_NAMES[idx]]
+                if not _alive(pid):
+                    code = self._exit_codes.get(pid)
+                    self._untrack(idx)
+                    lines.append(f"💀 {NODE_NAMES[idx]} exited (code {code})")
+        return lines
+    
+    def _wait_exit(self, pids, timeout: float, any_exit: bool = False) -> bool:
+        """Block until all (or any) of pids have been reaped, up to timeout"""
+        done = any if any_exit else all
+        deadline = time.monotonic() + timeout
+        # With SIGCHLD blocked, an exit between the check and the wait stays
+        # pending and ends sigtimedwait at once instead of being lost
+        old_mask = signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGCHLD})
         try:
-            process = self.processes[node_name]
-            process.terminate()
-            process.wait(timeout=5)
-            del self.processes[node_name]
-            print(f"🛑 {node_name} stopped")
-            return True
-        except Exception as e:
-            print(f"❌ Error stopping {node_name}: {e}")
+            while True:
+                self._reap_children()
+                if done(not _alive(pid) for pid in pids):
+                    return True
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                signal.sigtimedwait({signal.SIGCHLD}, remaining)
+        finally:
+            signal.pthread_sigmask(signal.SIG_SETMASK, old_mask)
+
+    def stop_node(self, idx: int) -> bool:
+        """Stop a single node"""
+        if not self.is_running(idx):
+            print(f"⚠️  {NODE_NAMES[idx]} is not running")
             return False
+        
+        self._stop([idx])
+        return True
     
     def stop_all_nodes(self):
         """Stop all running nodes"""
@@ -92,37 +284,61 @@ class ROS2NodeLauncher:
             return
         
         print(f"🛑 Stopping {len(self.processes)} node(s)...")
-        for node_name in list(self.processes.keys()):
-            self.stop_node(node_name)
+        self._stop([idx for idx in range(len(NODE_NAMES)) if self.is_running(idx)])
         print("✅ All nodes stopped")
     
+    def _stop(self, indices: List[int]):
+        """SIGTERM the given nodes, reap them, and SIGKILL any left at the deadline"""
+        pending = {}
+        for idx in indices:
+            pid = self.processes[NODE_NAMES[idx]]
+            try:
+                os.killpg(pid, signal.SIGTERM)
+                pending[idx] = pid
+            except ProcessLookupError:
+                self._untrack(idx)
+                print(f"🛑 {NODE_NAMES[idx]} stopped")
+        
+        # One shared deadline for every child instead of one per node
+        deadline = time.monotonic() + STOP_TIMEOUT
+        while pending and self._wait_exit(pending.values(), deadline - time.monotonic(), any_exit=True):
+            for idx in [i for i, pid in pending.items() if not _alive(pid)]:
+                del pending[idx]
+                self._untrack(idx)
+                print(f"🛑 {NODE_NAMES[idx]} stopped")
+        
+        for idx, pid in pending.items():
+            try:
+                os.killpg(pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+        self._wait_exit(pending.values(), STOP_TIMEOUT)
+        for idx in pending:
+            self._untrack(idx)
+            print(f"💀 {NODE_NAMES[idx]} killed after {STOP_TIMEOUT:.0f}s")
+    
     def show_status(self):
         """Show status of running nodes"""
+        lines = self._reap_dead()
         if not self.processes:
-            print("\n⚪ No nodes are currently running")
-            return
-        
-        print(f"\n🟢 Running Nodes ({len(self.processes)}):")
-        for node_name, process in self.processes.items():
-            print(f"   • {node_name:<25} PID: {process.pid}")
+            lines.append("\n⚪ No nodes are currently running")
+        else:
+            lines.append(f"\n🟢 Running Nodes ({len(self.processes)}):")
+            lines += [f"   • {name:<25} PID: {pid}" for name, pid in self.processes.items()]
+        _write_lines(lines)
     
     def launch_multiple(self, node_keys: List[str]):
         """Launch multiple nodes"""
-        for key in node_keys:
-            key = key.strip()
-            if key in self.available_nodes:
-                node_name = self.available_nodes[key]['name']
-                self.launch_node(node_name)
-                time.sleep(0.5)  # Small delay between launches
-            else:
-                print(f"⚠️  Invalid node key: {key}")
+        keys = [key.strip() for key in node_keys]
+        bad = [key for key in keys if key not in VALID_KEYS]
+        if bad:
+            print(f"⚠️  Invalid node key(s): {', '.join(bad)}")
+        self._launch_batch([int(key) - 1 for key in keys if key in VALID_KEYS])
     
     def launch_all(self):
         """Launch all available nodes"""
         print("🚀 Launching all nodes...")
-        for node_info in self.available_nodes.values():
-            self.launch_node(node_info['name'])
-            time.sleep(0.5)
+        self._launch_batch(list(range(len(NODE_NAMES))))
     
     def cleanup(self):
         """Cleanup on exit"""
@@ -132,76 +348,181 @@ class ROS2NodeLauncher:
     
     def run_interactive(self):
         """Run interactive mode"""
-        # Setup signal handler for Ctrl+C
+        # Nodes run in their own sessions, so Ctrl+C, kill and terminal
+        # hangup reach only the launcher; each must still stop the nodes
         def signal_handler(sig, frame):
+            if sig == signal.SIGHUP:
+                _detach_stdout()
             self.cleanup()
             sys.exit(0)
         
-        signal.signal(signal.SIGINT, signal_handler)
+        for sig in (signal.SIGINT, signal.SIGTERM, signal.SIGHUP):
+            signal.signal(sig, signal_handler)
+        self._install_reaper()
         
         print("\n🤖 ROS2 Node Launcher Started")
         print("   Package: " + self.package_name)
         
+        selector = selectors.DefaultSelector()
+        try:
+            selector.register(sys.stdin, selectors.EVENT_READ)
+        except (PermissionError, ValueError):
+            # Regular files (e.g. '< cmds.txt') cannot be polled; read them in order
+            selector.close()
+            self._run_line_loop()
+            return
+        
+        wake_r, wake_w = os.pipe()
+        os.set_blocking(wake_r, False)
+        os.set_blocking(wake_w, False)
+        self._wakeup_fd = wake_w
+        selector.register(wake_r, selectors.EVENT_READ)
+        stdin_fd = sys.stdin.fileno()
+        partial = b''
+        try:
+            self._prompt()
+            while True:
+                for key, _ in selector.select():
+                    if key.fileobj is sys.stdin:
+                        # Read the raw fd: a buffered readline() would swallow
+                        # lines that arrived together and hide them from select()
+                        data = os.read(stdin_fd, 4096)
+                        *lines, partial = (partial + data).split(b'\n')
+                        if not data and partial:
+                            lines, partial = [partial], b''
+                        for line in lines:
+                            if not self._handle_choice(line.decode(errors='replace').strip().lower()):
+                                self.cleanup()
+                                return
+                        if not data:
+                            self.cleanup()
+                            return
+                # Coalesce child exits and the command into a single redraw
+                try:
+                    while os.read(wake_r, 64):
+                        pass
+                except BlockingIOError:
+                    pass
+                _write_lines(self._reap_dead())
+                self._prompt()
+        finally:
+            self._wakeup_fd = None
+            selector.close()
+            os.close(wake_r)
+            os.close(wake_w)
+    
+    def _run_line_loop(self):
+        """Blocking fallback for stdin that cannot be registered with a selector"""
         while True:
-            self.display_menu()
-            choice = input("\nEnter your choice: ").strip().lower()
-            
-            if choice in ['quit', 'q', 'exit']:
+            _write_lines(self._reap_dead())
+            self._prompt()
+            line = sys.stdin.readline()
+            if not line or not self._handle_choice(line.strip().lower()):
                 self.cleanup()
-                break
-            
-            elif choice == 'all':
-                self.launch_all()
-            
-            elif choice == 'stop':
-                self.stop_all_nodes()
-            
-            elif choice == 'status':
-                self.show_status()
-            
-            elif ',' in choice:
-                # Multiple nodes: 1,2,3
-                node_keys = choice.split(',')
-                self.launch_multiple(node_keys)
-            
-            elif choice in self.available_nodes:
-                # Single node
-                node_name = self.available_nodes[choice]['name']
-                self.launch_node(node_name)
-            
-            else:
-                print("⚠️  Invalid choice. Try again.")
-            
-            input("\nPress Enter to continue...")
+                return
+    
+    def _prompt(self):
+        """Redraw the menu and the input prompt"""
+        self.display_menu()
+        sys.stdout.write("\nEnter your choice: ")
+        sys.stdout.flush()
+    
+    def _handle_choice(self, choice: str) -> bool:
+        """Run one interactive command; returns False when asked to quit"""
+        if choice in ['quit', 'q', 'exit']:
+            return False
+        
+        elif choice == 'all':
+            self.launch_all()
+        
+        elif choice == 'stop':
+            self.stop_all_nodes()
+        
+        elif choice == 'status':
+            self.show_status()
+        
+        elif ',' in choice:
+            # Multiple nodes: 1,2,3
+            node_keys = choice.split(',')
+            self.launch_multiple(node_keys)
+        
+        elif choice in VALID_KEYS:
+            # Single node
+            self.launch_node(int(choice) - 1)
+        
+        elif choice:
+            print("⚠️  Invalid choice. Try again.")
+        return True
     
     def run_command_line(self, args):
         """Run with command line arguments"""
         if args.list:
             print("\nAvailable Nodes:")
-            for key, node in self.available_nodes.items():
-                print(f"  {key}: {node['name']}")
+            for i, node_name in enumerate(NODE_NAMES, 1):
+                print(f"  {i}: {node_name}")
             return
         
-        if args.all:
-            self.launch_all()
-        
-        elif args.nodes:
-            for node_key in args.nodes:
-                if node_key in self.available_nodes:
-                    node_name = self.available_nodes[node_key]['name']
-                    self.launch_node(node_name)
-                else:
-                    print(f"⚠️  Invalid node key: {node_key}")
-        
-        if self.processes:
-            print("\n✅ Nodes launched. Press Ctrl+C to stop all nodes.")
-            try:
-                # Keep running until interrupted
-                signal.pause()
-            except KeyboardInterrupt:
+        self._install_reaper()
+        # Nodes run in their own sessions, so Ctrl+C and terminal hangup reach
+        # only the launcher. Stop signals stay blocked so one can never land
+        # between spawn and track; launches check for them and stop early.
+        stop_signals = {signal.SIGINT, signal.SIGTERM, signal.SIGHUP}
+        old_mask = signal.pthread_sigmask(signal.SIG_BLOCK, stop_signals)
+        self._stop_signals = stop_signals
+        waiting = False
+        try:
+            if args.all:
+                self.launch_all()
+            
+            elif args.nodes:
+                self.launch_multiple(args.nodes)
+            
+            if self._aborted:
+                print("\n⛔ Launch interrupted")
+            elif self.processes:
+                print("\n✅ Nodes launched. Press Ctrl+C to stop all nodes.")
+                waiting = True
+                # Block in-kernel until interrupted or every node has exited;
+                # sweep once for nodes that exited before SIGCHLD was blocked
+                watched = stop_signals | {signal.SIGCHLD}
+                signal.pthread_sigmask(signal.SIG_BLOCK, watched)
+                _write_lines(self._reap_dead())
+                while self.processes:
+                    sig = signal.sigwait(watched)
+                    if sig == signal.SIGHUP:
+                        _detach_stdout()
+                    if sig != signal.SIGCHLD:
+                        break
+                    _write_lines(self._reap_dead())
+        finally:
+            if self.processes:
                 self.cleanup()
+            elif waiting:
+                print("\n👋 All nodes have exited")
+            self._stop_signals = None
+            # Drop interrupts that arrived during cleanup before unblocking
+            while signal.sigtimedwait(stop_signals, 0) is not None:
+                pass
+            signal.pthread_sigmask(signal.SIG_SETMASK, old_mask)
+
+def _non_negative_float(value: str) -> float:
+    """argparse type for --launch-delay"""
+    import argparse
+    try:
+        delay = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid number: {value!r}")
+    if not 0 <= delay < float('inf'):  # also rejects nan
+        raise argparse.ArgumentTypeError(f"must be a finite number >= 0, got {value}")
+    return delay
 
 def main():
+    # Interactive mode (default if no args) never needs the argument parser
+    if len(sys.argv) == 1:
+        ROS2NodeLauncher().run_interactive()
+        return
+    
+    import argparse
     parser = argparse.ArgumentParser(
         description='ROS2 Node Launcher - Launch single or multiple ROS2 nodes easily'
     )
@@ -225,12 +546,17 @@ def main():
         action='store_true',
         help='Run in interactive mode'
     )
+    parser.add_argument(
+        '-d', '--launch-delay',
+        type=_non_negative_float,
+        default=0.0,
+        help='Extra delay in seconds between launches (default: 0)'
+    )
     
     args = parser.parse_args()
-    launcher = ROS2NodeLauncher()
+    launcher = ROS2NodeLauncher(launch_delay=args.launch_delay)
     
-    # Interactive mode (default if no args)
-    if args.interactive or len(sys.argv) == 1:
+    if args.interactive:
         launcher.run_interactive()
     else:
         launcher.run_command_line(args)